@@ -0,0 +1,91 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import time
+
+from mlrun.utils.db import BodyCodec
+
+# Compares the size and the encode / decode latency of the codecs used for the object bodies stored in the DB
+# (see httpdb.db.body_codec), using a run body of a typical size
+
+
+def generate_run_body(results_count: int = 200, artifacts_count: int = 20) -> dict:
+    return {
+        "kind": "run",
+        "metadata": {
+            "name": "train-model",
+            "uid": "8ae6c1e2a0b34d0fae0d5a3b4b0c6f11",
+            "project": "benchmark",
+            "iteration": 0,
+            "labels": {"kind": "job", "owner": "admin", "host": "train-model-x7k2p"},
+        },
+        "spec": {
+            "function": "benchmark/train-model@0123456789abcdef",
+            "handler": "train",
+            "parameters": {f"param_{i}": i * 0.5 for i in range(50)},
+            "inputs": {"dataset": "store://datasets/benchmark/dataset:latest"},
+            "output_path": "v3io:///projects/benchmark/artifacts",
+            "notifications": [],
+        },
+        "status": {
+            "state": "completed",
+            "start_time": "2024-01-01T00:00:00.000000+00:00",
+            "last_update": "2024-01-01T00:10:00.000000+00:00",
+            "results": {f"metric_{i}": i / 3 for i in range(results_count)},
+            "artifacts": [
+                {
+                    "kind": "model",
+                    "metadata": {"key": f"model-{i}", "tree": "tree-id", "iter": 0},
+                    "spec": {
+                        "target_path": f"v3io:///projects/benchmark/model-{i}.pkl",
+                        "format": "pkl",
+                        "size": 1024 * i,
+                        "parameters": {f"p{j}": j for j in range(10)},
+                    },
+                    "status": {"state": "created"},
+                }
+                for i in range(artifacts_count)
+            ],
+        },
+    }
+
+
+def measure(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB body codec benchmark")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--results", type=int, default=200)
+    parser.add_argument("--artifacts", type=int, default=20)
+    args = parser.parse_args()
+
+    body = generate_run_body(args.results, args.artifacts)
+    print(f"{'codec':<20}{'size (bytes)':>15}{'encode (us)':>15}{'decode (us)':>15}")
+    for codec in [BodyCodec.pickle, BodyCodec.json, BodyCodec.compressed_json]:
+        encoded = BodyCodec.encode(body, codec=codec)
+        encode_time = measure(
+            lambda: BodyCodec.encode(body, codec=codec), args.iterations
+        )
+        decode_time = measure(lambda: BodyCodec.decode(encoded), args.iterations)
+        print(f"{codec:<20}{len(encoded):>15}{encode_time:>15.1f}{decode_time:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import subprocess
+import sys
+
+# Reports the modules that take the most time to import when running `import <module>` (based on the output of
+# `python -X importtime`), use it to find the imports to defer when `import mlrun` becomes slow.
+
+
+def collect_import_times(module: str) -> list[tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # the header line
+            continue
+        import_times.append(
+            (name.strip(), int(self_time.strip()), int(cumulative_time.strip()))
+        )
+    return import_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time report")
+    parser.add_argument("--module", default="mlrun")
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument(
+        "--sort-by", choices=["cumulative", "self"], default="cumulative"
+    )
+    args = parser.parse_args()
+
+    import_times = collect_import_times(args.module)
+    sort_index = 2 if args.sort_by == "cumulative" else 1
+    import_times.sort(key=lambda import_time: import_time[sort_index], reverse=True)
+    total = max(cumulative for _, _, cumulative in import_times)
+
+    print(f"import {args.module}: {total / 1e3:.1f} ms, {len(import_times)} modules")
+    print(f"{'module':<60}{'self (ms)':>12}{'cumulative (ms)':>18}")
+    for name, self_time, cumulative_time in import_times[: args.top]:
+        print(f"{name:<60}{self_time / 1e3:>12.1f}{cumulative_time / 1e3:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
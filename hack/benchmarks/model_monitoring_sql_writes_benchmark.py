@@ -0,0 +1,109 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import tempfile
+import time
+
+import mlrun.common.schemas.model_monitoring as mm_schemas
+from mlrun.model_monitoring.db.stores.sqldb.sql_store import SQLStoreBase
+
+# Compares the throughput of the application results writes of the SQL model monitoring store: the previous path
+# (a query and a one row `to_sql` or an update session per event), an immediate upsert per event, and batched upserts
+
+
+def generate_events(endpoints: int, applications: int, rounds: int) -> list[dict]:
+    return [
+        {
+            mm_schemas.WriterEvent.ENDPOINT_ID: f"endpoint-{endpoint}",
+            mm_schemas.WriterEvent.APPLICATION_NAME: f"app-{application}",
+            mm_schemas.WriterEvent.START_INFER_TIME: f"2024-06-01 {10 + i % 10}:00:00",
+            mm_schemas.WriterEvent.END_INFER_TIME: f"2024-06-01 {11 + i % 10}:00:00",
+            mm_schemas.ResultData.RESULT_NAME: "data-drift",
+            mm_schemas.ResultData.RESULT_KIND: 0,
+            mm_schemas.ResultData.RESULT_VALUE: i / 100,
+            mm_schemas.ResultData.RESULT_STATUS: 0,
+            mm_schemas.ResultData.RESULT_EXTRA_DATA: "",
+        }
+        for i in range(rounds)
+        for endpoint in range(endpoints)
+        for application in range(applications)
+    ]
+
+
+def write_previous(store: SQLStoreBase, event: dict) -> None:
+    # The write path before the batched upserts
+    table = store.application_results_table
+    uid = store._generate_application_result_uid(event)
+    criteria = [table.uid == uid]
+    if store._get(table=table, criteria=criteria):
+        store._convert_to_datetime(event, mm_schemas.WriterEvent.START_INFER_TIME)
+        store._convert_to_datetime(event, mm_schemas.WriterEvent.END_INFER_TIME)
+        store._update(attributes=event, table=table, criteria=criteria)
+    else:
+        event[mm_schemas.EventFieldType.UID] = uid
+        store._write(table_name=mm_schemas.FileTargetKind.APP_RESULTS, event=event)
+
+
+def measure(name: str, connection_string: str, events: list[dict], **kwargs):
+    store = SQLStoreBase(
+        project="benchmark", store_connection_string=connection_string, **kwargs
+    )
+    store.create_tables()
+    start = time.perf_counter()
+    for event in events:
+        if name == "previous":
+            write_previous(store, event.copy())
+        else:
+            store.write_application_event(event.copy())
+    store.flush()
+    total = time.perf_counter() - start
+    print(f"{name:<30}{total:>12.2f}{len(events) / total:>18.1f}")
+    store._delete(table=store.application_results_table, criteria=[])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Model monitoring SQL store writes benchmark"
+    )
+    parser.add_argument("--endpoints", type=int, default=20)
+    parser.add_argument("--applications", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--connection-string",
+        help="The SQL connection string, defaults to a temporary sqlite DB",
+    )
+    args = parser.parse_args()
+
+    events = generate_events(args.endpoints, args.applications, args.rounds)
+    print(f"{'path':<30}{'total (s)':>12}{'events / s':>18}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        connection_string = args.connection_string or (
+            f"sqlite:///{os.path.join(tmp_dir, 'benchmark.db')}"
+        )
+        measure("previous", connection_string, events)
+        measure("upsert per event", connection_string, events)
+        measure(
+            f"batched upserts ({args.batch_size})",
+            connection_string,
+            events,
+            batching_max_events=args.batch_size,
+            batching_timeout_secs=60,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import time
+
+import mlrun
+import mlrun.feature_store as fstore
+from mlrun.model import ModelObj
+
+# Measures the to_dict / from_dict latency of the ModelObj classes on the hot paths (run submission, run copies in
+# hyper-param generators and API responses). Run it on two revisions to compare them.
+
+
+def generate_run(parameters_count: int = 50) -> mlrun.RunObject:
+    run = mlrun.new_task(
+        "train-model",
+        project="benchmark",
+        handler="train",
+        params={f"param_{i}": i * 0.5 for i in range(parameters_count)},
+        inputs={"dataset": "store://datasets/benchmark/dataset:latest"},
+        artifact_path="v3io:///projects/benchmark/artifacts",
+    )
+    run = mlrun.RunObject.from_dict(run.to_dict())
+    run.status.state = "completed"
+    run.status.results = {f"metric_{i}": i / 3 for i in range(parameters_count)}
+    return run
+
+
+def generate_function_spec() -> ModelObj:
+    function = mlrun.new_function(
+        "train-model", project="benchmark", kind="job", image="mlrun/mlrun"
+    )
+    function.set_envs({f"ENV_{i}": str(i) for i in range(10)})
+    function.with_requests(mem="1G", cpu=1)
+    return function.spec
+
+
+def generate_feature_set(features_count: int = 50) -> fstore.FeatureSet:
+    feature_set = fstore.FeatureSet(
+        "transactions", entities=[fstore.Entity("id")], timestamp_key="time"
+    )
+    for i in range(features_count):
+        feature_set.add_feature(fstore.Feature(name=f"feature_{i}", value_type="float"))
+    return feature_set
+
+
+def measure(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ModelObj serialization benchmark")
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{'object':<20}{'to_dict (us)':>15}{'from_dict (us)':>15}{'round trip (us)':>17}"
+    )
+    for name, obj in [
+        ("RunObject", generate_run()),
+        ("KubeResourceSpec", generate_function_spec()),
+        ("FeatureSet", generate_feature_set()),
+    ]:
+        struct = obj.to_dict()
+        obj_class = type(obj)
+        to_dict_time = measure(obj.to_dict, args.iterations)
+        from_dict_time = measure(lambda: obj_class.from_dict(struct), args.iterations)
+        round_trip_time = measure(
+            lambda: obj_class.from_dict(obj.to_dict()), args.iterations
+        )
+        print(
+            f"{name:<20}{to_dict_time:>15.1f}{from_dict_time:>15.1f}{round_trip_time:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()